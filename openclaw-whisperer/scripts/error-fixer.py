@@ -2,6 +2,7 @@
 """Error diagnosis and auto-fix CLI for OpenClaw."""
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
@@ -9,16 +10,31 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import click
-from rich.console import Console
-from rich.panel import Panel
 
 from scripts.lib.error_database import ErrorDatabase
 from scripts.lib.error_parser import ErrorParser
 from scripts.lib.fix_engine import FixEngine
 from scripts.lib.notification_hooks import NotificationHooks
+from scripts.lib.utils import get_console, print_json, print_json_stream
 from scripts.lib.error_fixer_display import display_suggestions, display_integration_suggestions
 
-console = Console()
+
+@functools.lru_cache(maxsize=None)
+def get_db() -> ErrorDatabase:
+    """Return the shared ErrorDatabase, loading patterns on first use."""
+    return ErrorDatabase()
+
+
+@functools.lru_cache(maxsize=None)
+def get_parser() -> ErrorParser:
+    """Return the shared ErrorParser."""
+    return ErrorParser()
+
+
+@functools.lru_cache(maxsize=None)
+def get_fix_engine() -> FixEngine:
+    """Return the shared FixEngine, loading recipes on first use."""
+    return FixEngine()
 
 
 def severity_badge(severity: str) -> str:
@@ -41,63 +57,69 @@ def severity_badge(severity: str) -> str:
 @click.option("--category", help="Filter by error category")
 def main(input_file, error_code, auto_fix, dry_run, json_output, category):
     """OpenClaw Error Diagnosis and Auto-Fix Tool."""
-    db = ErrorDatabase()
-    parser = ErrorParser()
-    fix_engine = FixEngine()
-
     # Category listing mode
     if category:
-        patterns = db.get_by_category(category)
+        patterns = get_db().get_by_category(category)
         if json_output:
-            console.print_json(data=[{"code": p.code, "title": p.title, "severity": p.severity} for p in patterns])
+            print_json([{"code": p.code, "title": p.title, "severity": p.severity} for p in patterns])
         else:
+            console = get_console()
             console.print(f"\n[bold]Errors in category: {category}[/bold]\n")
             for p in patterns:
                 console.print(f"{severity_badge(p.severity)} {p.code}: {p.title}")
         return
 
     # Parse errors from source
-    errors = []
+    db = get_db()
     if error_code:
         patterns = db.match_exact_code(error_code)
         if not patterns:
-            console.print(f"[red]Error code not found: {error_code}[/red]")
+            get_console().print(f"[red]Error code not found: {error_code}[/red]")
             sys.exit(1)
         errors = [(error_code, error_code, patterns)]
     else:
-        parsed = parser.parse_log_file(Path(input_file)) if input_file else parser.parse_stdin()
-        for pe in parsed:
-            patterns = db.diagnose(pe.error_message, pe.error_code)
-            if patterns:
-                errors.append((pe.error_message, pe.error_code, patterns))
-
-    if not errors:
-        console.print("[yellow]No errors detected.[/yellow]")
-        return
+        errors = _iter_diagnosed(db, input_file)
 
     # Output results
     if json_output:
-        output_data = []
-        for msg, code, patterns in errors:
-            for p in patterns:
-                output_data.append({
-                    "code": p.code,
-                    "severity": p.severity,
-                    "title": p.title,
-                    "description": p.description,
-                    "causes": p.causes,
-                    "fix_steps": p.fix_steps,
-                    "auto_fixable": bool(p.fix_recipe_id and fix_engine.can_auto_fix(p.fix_recipe_id))
-                })
-        console.print_json(data=output_data)
+        # Stream records as they are diagnosed so huge logs stay bounded
+        records = (
+            {
+                "code": p.code,
+                "severity": p.severity,
+                "title": p.title,
+                "description": p.description,
+                "causes": p.causes,
+                "fix_steps": p.fix_steps,
+                "auto_fixable": bool(p.fix_recipe_id and get_fix_engine().can_auto_fix(p.fix_recipe_id))
+            }
+            for msg, code, patterns in errors
+            for p in patterns
+        )
+        if not print_json_stream(records):
+            get_console().print("[yellow]No errors detected.[/yellow]")
         return
 
-    # Rich panel output
+    # Rich panel output, printed as each error is diagnosed; a pattern
+    # matched on an earlier line is not rendered again, and each fix
+    # recipe is queued once even when several patterns share it
+    from rich.panel import Panel
+
+    console = get_console()
     auto_fixable = 0
     manual_needed = 0
+    error_count = 0
+    seen_ids: set[str] = set()
+    queued_recipes: set[str] = set()
+    to_run = []
 
     for msg, code, patterns in errors:
+        error_count += 1
         for p in patterns:
+            if p.id in seen_ids:
+                continue
+            seen_ids.add(p.id)
+
             # Build panel content
             content = []
             content.append(f"[bold]{severity_badge(p.severity)}[/bold]")
@@ -115,9 +137,12 @@ def main(input_file, error_code, auto_fix, dry_run, json_output, category):
                     content.append(f"  {i}. {step}")
                 content.append("")
 
-            if p.fix_recipe_id and fix_engine.can_auto_fix(p.fix_recipe_id):
+            if p.fix_recipe_id and get_fix_engine().can_auto_fix(p.fix_recipe_id):
                 content.append("[bold yellow]⚡ Auto-fix available[/bold yellow]")
                 auto_fixable += 1
+                if p.fix_recipe_id not in queued_recipes:
+                    queued_recipes.add(p.fix_recipe_id)
+                    to_run.append(p)
             else:
                 manual_needed += 1
 
@@ -131,8 +156,15 @@ def main(input_file, error_code, auto_fix, dry_run, json_output, category):
             )
             console.print(panel)
 
+    if not error_count:
+        console.print("[yellow]No errors detected.[/yellow]")
+        return
+
     # Summary
-    console.print(f"\n[bold]Summary:[/bold] {len(errors)} errors found, {auto_fixable} auto-fixable, {manual_needed} need manual intervention\n")
+    console.print(
+        f"\n[bold]Summary:[/bold] {error_count} errors found, {len(seen_ids)} distinct diagnoses: "
+        f"{auto_fixable} auto-fixable, {manual_needed} need manual intervention\n"
+    )
 
     # Auto-fix execution
     if auto_fix and auto_fixable > 0:
@@ -142,34 +174,32 @@ def main(input_file, error_code, auto_fix, dry_run, json_output, category):
         all_notification_suggestions = []
         notification_hooks = NotificationHooks()
 
-        for msg, code, patterns in errors:
-            for p in patterns:
-                if p.fix_recipe_id and fix_engine.can_auto_fix(p.fix_recipe_id):
-                    result = fix_engine.execute(p.fix_recipe_id, dry_run=dry_run)
-                    if result.success:
-                        console.print(f"[green]✓[/green] {result.message}")
-                    else:
-                        console.print(f"[red]✗[/red] {result.message}")
-                    for action in result.actions_taken:
-                        console.print(f"  {action}")
-
-                    # Collect suggestions
-                    if result.diagnostic_suggestions:
-                        all_diag_suggestions.extend(result.diagnostic_suggestions)
-                    if result.recovery_suggestions:
-                        all_recovery_suggestions.extend(result.recovery_suggestions)
-
-                    # Check notification triggers
-                    notif_context = {
-                        "unresolved": not result.success,
-                        "critical_error": "critical" in p.code.lower(),
-                        "error_code": p.code,
-                        "skill_suggestions_count": len(result.diagnostic_suggestions) + len(result.recovery_suggestions),
-                        "resolution_unclear": len(result.needs_manual) > 0
-                    }
-                    notif_sug = notification_hooks.check_triggers(notif_context)
-                    if notif_sug:
-                        all_notification_suggestions.extend(notif_sug)
+        for p in to_run:
+            result = get_fix_engine().execute(p.fix_recipe_id, dry_run=dry_run)
+            if result.success:
+                console.print(f"[green]✓[/green] {result.message}")
+            else:
+                console.print(f"[red]✗[/red] {result.message}")
+            for action in result.actions_taken:
+                console.print(f"  {action}")
+
+            # Collect suggestions
+            if result.diagnostic_suggestions:
+                all_diag_suggestions.extend(result.diagnostic_suggestions)
+            if result.recovery_suggestions:
+                all_recovery_suggestions.extend(result.recovery_suggestions)
+
+            # Check notification triggers
+            notif_context = {
+                "unresolved": not result.success,
+                "critical_error": "critical" in p.code.lower(),
+                "error_code": p.code,
+                "skill_suggestions_count": len(result.diagnostic_suggestions) + len(result.recovery_suggestions),
+                "resolution_unclear": len(result.needs_manual) > 0
+            }
+            notif_sug = notification_hooks.check_triggers(notif_context)
+            if notif_sug:
+                all_notification_suggestions.extend(notif_sug)
 
         # Display collected suggestions
         _show_all_suggestions(
@@ -178,6 +208,16 @@ def main(input_file, error_code, auto_fix, dry_run, json_output, category):
         )
 
 
+def _iter_diagnosed(db: ErrorDatabase, input_file: str | None):
+    """Yield (message, code, patterns) for each diagnosable error, streaming log files."""
+    parser = get_parser()
+    parsed = parser.iter_log_file(Path(input_file)) if input_file else parser.parse_stdin()
+    for pe in parsed:
+        patterns = db.diagnose(pe.error_message, pe.error_code)
+        if patterns:
+            yield pe.error_message, pe.error_code, patterns
+
+
 def _show_all_suggestions(console, diag, recovery, notif):
     """Display all suggestion panels."""
     if diag:
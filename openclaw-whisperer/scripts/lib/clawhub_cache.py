@@ -9,6 +9,10 @@ CACHE_FILE = DATA_DIR / "clawhub-cache.json"
 CACHE_MAX_AGE = 86400  # 24 hours in seconds
 CACHE_VERSION = "2.0.0"
 
+# Lowercased search blobs for the most recently indexed skills list,
+# keyed on the identity of that list so a replaced list is re-indexed
+_search_index: tuple[list | None, list[str]] = (None, [])
+
 
 def is_cache_fresh(cache_data: dict) -> bool:
     """Check if cache is less than 24 hours old."""
@@ -23,7 +27,10 @@ def load_cache() -> dict:
     try:
         if CACHE_FILE.exists():
             data = load_json(CACHE_FILE)
-            return data if isinstance(data, dict) else {}
+            if isinstance(data, dict):
+                build_search_index(data)
+                return data
+            return {}
     except Exception:
         pass
     return {}
@@ -109,6 +116,36 @@ def save_cache(data: dict) -> dict:
     return enriched
 
 
+def build_search_index(cache_data: dict) -> list[str]:
+    """Build (or reuse) the lowercased search index for cached skills.
+
+    Each skill's name, description and tags are joined with NUL separators
+    and lowercased once, so a query needs only one substring test per skill.
+
+    Args:
+        cache_data: Loaded cache dict
+
+    Returns:
+        Search blobs parallel to cache_data["skills"]
+    """
+    global _search_index
+    skills = cache_data.get("skills", [])
+    indexed_skills, blobs = _search_index
+    if indexed_skills is skills and len(blobs) == len(skills):
+        return blobs
+
+    blobs = [
+        "\0".join([
+            skill_data.get("name", ""),
+            skill_data.get("description", ""),
+            *skill_data.get("tags", []),
+        ]).lower()
+        for skill_data in skills
+    ]
+    _search_index = (skills, blobs)
+    return blobs
+
+
 def search_cache(cache_data: dict, query: str, limit: int) -> list[dict]:
     """Search cached skills by keyword matching.
 
@@ -124,16 +161,13 @@ def search_cache(cache_data: dict, query: str, limit: int) -> list[dict]:
         return []
 
     query_lower = query.lower()
+    blobs = build_search_index(cache_data)
     matches = []
 
-    for skill_data in cache_data["skills"]:
-        name = skill_data.get("name", "").lower()
-        desc = skill_data.get("description", "").lower()
-        tags = [t.lower() for t in skill_data.get("tags", [])]
-
-        if (query_lower in name or
-            query_lower in desc or
-            any(query_lower in tag for tag in tags)):
+    for skill_data, blob in zip(cache_data["skills"], blobs):
+        if query_lower in blob:
             matches.append(skill_data)
+            if len(matches) >= limit:
+                break
 
     return matches[:limit]
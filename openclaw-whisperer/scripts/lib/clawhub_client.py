@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import json
 import subprocess
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from .utils import load_json, which_binary
@@ -22,6 +23,16 @@ class SkillInfo:
     downloads: int
     verified: bool
     updated_at: str | None
+    # Lowercased copies derived once, reused by every scoring pass
+    name_lower: str = field(init=False, repr=False, compare=False)
+    description_lower: str = field(init=False, repr=False, compare=False)
+    tags_lower: list[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Derive lowercased text fields used for matching."""
+        self.name_lower = (self.name or "").lower()
+        self.description_lower = (self.description or "").lower()
+        self.tags_lower = [t.lower() for t in self.tags] if self.tags else []
 
 
 class ClawHubClient:
@@ -78,6 +89,41 @@ class ClawHubClient:
         matches = search_cache(self.cache_data, query, limit)
         return [self._parse_skill_data(s) for s in matches]
 
+    def multi_search(self, queries: list[str], limit: int = 20) -> dict[str, list[SkillInfo]]:
+        """Search several queries in one batch, grouped by query.
+
+        CLI searches run concurrently and the cache is written once for the
+        whole batch. Queries the CLI cannot answer fall back to the cache.
+        """
+        results: dict[str, list[SkillInfo]] = {}
+        if not queries:
+            return results
+
+        if self.is_cli_available():
+            workers = min(8, len(queries))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                raw_results = list(pool.map(
+                    lambda q: self._run_clawhub(["search", q, "--json", "--limit", str(limit)]),
+                    queries
+                ))
+
+            fetched = {}
+            for query, result in zip(queries, raw_results):
+                if result and "skills" in result:
+                    results[query] = [self._parse_skill_data(s) for s in result["skills"]]
+                    for skill_data in result["skills"]:
+                        fetched.setdefault(skill_data.get("slug"), skill_data)
+            if fetched:
+                self.cache_data["skills"] = list(fetched.values())
+                self.cache_data = save_cache(self.cache_data)
+
+        # Fallback to cache search
+        for query in queries:
+            if query not in results:
+                matches = search_cache(self.cache_data, query, limit)
+                results[query] = [self._parse_skill_data(s) for s in matches]
+        return results
+
     def list_installed(self) -> list[SkillInfo]:
         """List installed skills from CLI or lock file."""
         if self.is_cli_available():
@@ -108,6 +154,32 @@ class ClawHubClient:
                 return self._parse_skill_data(result)
         return None
 
+    def get_skill_info_many(self, slugs: list[str]) -> dict[str, SkillInfo]:
+        """Lookup several skills by slug, querying the CLI concurrently.
+
+        Returns:
+            Dict of slug -> SkillInfo for every slug that was found
+        """
+        found: dict[str, SkillInfo] = {}
+        cached = {}
+        for skill_data in self.cache_data.get("skills", []):
+            cached.setdefault(skill_data.get("slug"), skill_data)
+        missing = []
+        for slug in slugs:
+            if slug in cached:
+                found[slug] = self._parse_skill_data(cached[slug])
+            else:
+                missing.append(slug)
+
+        if missing and self.is_cli_available():
+            workers = min(16, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(lambda s: self._run_clawhub(["info", s, "--json"]), missing)
+                for slug, result in zip(missing, results):
+                    if result:
+                        found[slug] = self._parse_skill_data(result)
+        return found
+
     def refresh_cache(self) -> bool:
         """Refresh cache by fetching latest skills from registry."""
         if not self.is_cli_available():
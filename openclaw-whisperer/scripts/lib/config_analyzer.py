@@ -1,15 +1,84 @@
 """OpenClaw configuration validator and analyzer."""
 from __future__ import annotations
 
+import functools
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
 from .utils import get_config
 
+# Sort rank for issue severities (errors first)
+SEVERITY_ORDER = {"error": 0, "warning": 1, "info": 2}
+
+# Accepted values for agent.sandboxMode
+SANDBOX_MODES = ("strict", "relaxed", "off")
+
+# Map channel -> required fields with alternates (any match = OK)
+CHANNEL_REQUIRED_FIELDS = {
+    "telegram": (("token", "botToken"),),  # accept either field name
+    "discord": (("token",),),
+    "slack": (("token",), ("appToken",)),
+    "whatsapp": (("dmPolicy",),),
+}
+
+
+# Seconds a cached workspace existence check stays valid
+WORKSPACE_CHECK_TTL = 10
+
+
+@functools.lru_cache(maxsize=128)
+def _workspace_exists(path_str: str, epoch: int) -> bool:
+    """Check workspace existence; epoch buckets expire cached results."""
+    return Path(path_str).expanduser().exists()
+
+
+def _section(parent: dict, key: str) -> dict:
+    """Return parent[key] if it is a dict, else an empty dict."""
+    value = parent.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def normalize_config(config: dict | None) -> dict:
+    """Fold flat and nested schema variants into one canonical view.
+
+    Resolves gateway.authMode / gateway.auth.mode, agent.model /
+    agents.defaults.model[.primary] and agent.workspace /
+    agents.defaults.workspace once, so checks read plain keys. Returns a
+    new dict; the loaded config, which fix steps write back, is untouched.
+    """
+    config = config or {}
+    gateway = _section(config, "gateway")
+    agent = _section(config, "agent")
+    agents = _section(config, "agents")
+    defaults = _section(agents, "defaults")
+
+    model = agent.get("model")
+    if not model:
+        model_cfg = defaults.get("model")
+        model = model_cfg.get("primary") if isinstance(model_cfg, dict) else model_cfg
+
+    agent_list = agents.get("list")
+    agent_list = agent_list if isinstance(agent_list, list) else []
+
+    return {
+        "gateway": {
+            "port": gateway.get("port"),
+            "bind": gateway.get("bind"),
+            "auth_mode": gateway.get("authMode") or _section(gateway, "auth").get("mode"),
+        },
+        "model": model,
+        "has_agent_model": any(a.get("model") for a in agent_list if isinstance(a, dict)),
+        "workspace": agent.get("workspace") or defaults.get("workspace"),
+        "sandbox_mode": agent.get("sandboxMode"),
+    }
+
 
 @dataclass
 class ConfigIssue:
     """Represents a configuration validation issue."""
+    __slots__ = ("severity", "path", "message", "fix_hint")
+
     severity: str  # "error" | "warning" | "info"
     path: str  # JSON path like "gateway.port"
     message: str
@@ -22,6 +91,9 @@ class ConfigAnalyzer:
     def __init__(self):
         """Initialize analyzer and load config."""
         self.config = get_config()
+        self.canonical = normalize_config(self.config)
+        # Enabled channels from the first detect_channels() call
+        self._channels_cache: list[str] | None = None
 
     def analyze(self) -> list[ConfigIssue]:
         """Run all configuration checks.
@@ -32,23 +104,22 @@ class ConfigAnalyzer:
         from .config_security_checks import check_security
 
         issues = []
-        issues.extend(self._check_gateway(self.config))
+        issues.extend(self._check_gateway(self.canonical))
         issues.extend(self._check_channels(self.config))
-        issues.extend(self._check_agents(self.config))
+        issues.extend(self._check_agents(self.canonical))
         issues.extend(self._check_skills(self.config))
         issues.extend(self._check_plugins(self.config))
         issues.extend(check_security(self.config))
 
-        severity_order = {"error": 0, "warning": 1, "info": 2}
-        issues.sort(key=lambda x: severity_order.get(x.severity, 3))
+        issues.sort(key=lambda x: SEVERITY_ORDER.get(x.severity, 3))
         return issues
 
-    def _check_gateway(self, config: dict) -> list[ConfigIssue]:
+    def _check_gateway(self, canonical: dict) -> list[ConfigIssue]:
         """Validate gateway configuration section."""
         issues = []
-        gateway = config.get("gateway", {})
+        gateway = canonical["gateway"]
 
-        port = gateway.get("port")
+        port = gateway["port"]
         if port is not None:
             if not isinstance(port, int) or port < 1 or port > 65535:
                 issues.append(ConfigIssue(
@@ -58,9 +129,7 @@ class ConfigAnalyzer:
                     fix_hint="Port must be between 1 and 65535"
                 ))
 
-        # Support both flat "authMode" and nested "auth.mode" schemas
-        auth_mode = gateway.get("authMode") or (gateway.get("auth", {}).get("mode") if isinstance(gateway.get("auth"), dict) else None)
-        if not auth_mode:
+        if not gateway["auth_mode"]:
             issues.append(ConfigIssue(
                 severity="warning",
                 path="gateway.authMode",
@@ -68,7 +137,7 @@ class ConfigAnalyzer:
                 fix_hint="Set gateway.auth.mode or gateway.authMode to 'password', 'token', or 'none'"
             ))
 
-        bind = gateway.get("bind")
+        bind = gateway["bind"]
         if bind and not isinstance(bind, str):
             issues.append(ConfigIssue(
                 severity="error",
@@ -84,15 +153,7 @@ class ConfigAnalyzer:
         issues = []
         channels = config.get("channels", {})
 
-        # Map channel -> required fields with alternates (any match = OK)
-        required_fields = {
-            "telegram": [["token", "botToken"]],  # accept either field name
-            "discord": [["token"]],
-            "slack": [["token"], ["appToken"]],
-            "whatsapp": [["dmPolicy"]]
-        }
-
-        for channel_name, field_groups in required_fields.items():
+        for channel_name, field_groups in CHANNEL_REQUIRED_FIELDS.items():
             channel_config = channels.get(channel_name, {})
             enabled = channel_config.get("enabled", False)
             # Also check nested accounts for credentials
@@ -115,24 +176,11 @@ class ConfigAnalyzer:
 
         return issues
 
-    def _check_agents(self, config: dict) -> list[ConfigIssue]:
-        """Validate agent configuration. Supports both flat and nested schemas."""
+    def _check_agents(self, canonical: dict) -> list[ConfigIssue]:
+        """Validate agent configuration (flat and nested schemas, pre-normalized)."""
         issues = []
-        # Support flat "agent" and nested "agents.defaults" schemas
-        agent = config.get("agent", {})
-        agents = config.get("agents", {})
-        defaults = agents.get("defaults", {})
-
-        # Model: flat agent.model OR nested agents.defaults.model.primary
-        model = agent.get("model")
-        if not model:
-            model_cfg = defaults.get("model", {})
-            model = model_cfg.get("primary") if isinstance(model_cfg, dict) else model_cfg
-        # Also check per-agent models in agents.list
-        agent_list = agents.get("list", [])
-        has_agent_model = any(a.get("model") for a in agent_list if isinstance(a, dict))
-
-        if not model and not has_agent_model:
+
+        if not canonical["model"] and not canonical["has_agent_model"]:
             issues.append(ConfigIssue(
                 severity="error",
                 path="agents.defaults.model.primary",
@@ -140,11 +188,10 @@ class ConfigAnalyzer:
                 fix_hint="Set agents.defaults.model.primary or agent.model"
             ))
 
-        # Workspace: flat or nested
-        workspace = agent.get("workspace") or defaults.get("workspace")
+        workspace = canonical["workspace"]
         if workspace:
-            workspace_path = Path(workspace).expanduser()
-            if not workspace_path.exists():
+            epoch = int(time.time() // WORKSPACE_CHECK_TTL)
+            if not _workspace_exists(str(workspace), epoch):
                 issues.append(ConfigIssue(
                     severity="warning",
                     path="agents.defaults.workspace",
@@ -152,9 +199,8 @@ class ConfigAnalyzer:
                     fix_hint="Create the directory or update the path"
                 ))
 
-        # Sandbox: flat agent.sandboxMode or per-agent sandbox.mode
-        sandbox = agent.get("sandboxMode")
-        if sandbox and sandbox not in ["strict", "relaxed", "off"]:
+        sandbox = canonical["sandbox_mode"]
+        if sandbox and sandbox not in SANDBOX_MODES:
             issues.append(ConfigIssue(
                 severity="error",
                 path="agent.sandboxMode",
@@ -189,19 +235,34 @@ class ConfigAnalyzer:
         return issues
 
     def detect_channels(self) -> list[str]:
-        """Detect enabled channel names."""
-        channels = self.config.get("channels", {})
-        return [name for name, cfg in channels.items() if cfg.get("enabled", False)]
+        """Detect enabled channel names, memoized on the loaded config."""
+        if self._channels_cache is None:
+            channels = self.config.get("channels", {})
+            self._channels_cache = [name for name, cfg in channels.items() if cfg.get("enabled", False)]
+        return self._channels_cache
 
     def detect_model(self) -> str | None:
         """Get configured AI model name (flat or nested schema)."""
-        model = self.config.get("agent", {}).get("model")
-        if not model:
-            model_cfg = self.config.get("agents", {}).get("defaults", {}).get("model", {})
-            model = model_cfg.get("primary") if isinstance(model_cfg, dict) else model_cfg
-        return model
+        return self.canonical["model"]
 
     def get_config_path(self, path: str):
         """Access config value using dot-notation path."""
         from .config_security_checks import get_config_path
         return get_config_path(self.config, path)
+
+
+_DEFAULT: ConfigAnalyzer | None = None
+
+
+def get_default_analyzer() -> ConfigAnalyzer:
+    """Return a shared ConfigAnalyzer, creating it on first use."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = ConfigAnalyzer()
+    return _DEFAULT
+
+
+def reset_default_analyzer() -> None:
+    """Drop the shared ConfigAnalyzer so the next use reloads the config."""
+    global _DEFAULT
+    _DEFAULT = None
@@ -32,6 +32,7 @@ class ErrorDatabase:
         """Initialize and load error patterns from JSON."""
         self.patterns: list[ErrorPattern] = []
         self._load_patterns()
+        self._build_indexes()
 
     def _load_patterns(self) -> None:
         """Load error patterns from data/error-patterns.json."""
@@ -39,6 +40,32 @@ class ErrorDatabase:
         if data:
             self.patterns = self._parse_patterns(data)
 
+    def _build_indexes(self) -> None:
+        """Precompute lookup structures reused by every diagnose() call.
+
+        Builds an uppercase code index, compiles each regex once (dropping
+        invalid ones) and tokenizes the text used for semantic scoring.
+        """
+        self._by_code: dict[str, list[ErrorPattern]] = {}
+        self._compiled: list[tuple[re.Pattern, ErrorPattern]] = []
+        self._word_sets: list[tuple[ErrorPattern, set[str], set[str], list[set[str]]]] = []
+
+        for pattern in self.patterns:
+            self._by_code.setdefault(pattern.code.upper(), []).append(pattern)
+
+            if pattern.pattern:
+                try:
+                    self._compiled.append((re.compile(pattern.pattern, re.IGNORECASE), pattern))
+                except re.error:
+                    pass
+
+            self._word_sets.append((
+                pattern,
+                set(re.findall(r'\w+', pattern.title.lower())),
+                set(re.findall(r'\w+', pattern.description.lower())),
+                [set(re.findall(r'\w+', cause.lower())) for cause in pattern.causes],
+            ))
+
     def _parse_patterns(self, data: dict) -> list[ErrorPattern]:
         """
         Convert JSON data to ErrorPattern instances.
@@ -81,8 +108,7 @@ class ErrorDatabase:
         Returns:
             List of matching ErrorPattern instances
         """
-        code_upper = code.upper()
-        return [p for p in self.patterns if p.code.upper() == code_upper]
+        return list(self._by_code.get(code.upper(), []))
 
     def match_regex(self, text: str) -> list[ErrorPattern]:
         """
@@ -94,15 +120,7 @@ class ErrorDatabase:
         Returns:
             List of matching ErrorPattern instances
         """
-        matches = []
-        for pattern in self.patterns:
-            if pattern.pattern:
-                try:
-                    if re.search(pattern.pattern, text, re.IGNORECASE):
-                        matches.append(pattern)
-                except re.error:
-                    continue
-        return matches
+        return [pattern for regex, pattern in self._compiled if regex.search(text)]
 
     def match_semantic(self, text: str) -> list[ErrorPattern]:
         """
@@ -118,20 +136,15 @@ class ErrorDatabase:
         words = set(re.findall(r'\w+', text_lower))
 
         scored_patterns = []
-        for pattern in self.patterns:
-            score = 0
-
+        for pattern, title_words, desc_words, cause_word_sets in self._word_sets:
             # Score against title
-            title_words = set(re.findall(r'\w+', pattern.title.lower()))
-            score += len(words & title_words) * 3
+            score = len(words & title_words) * 3
 
             # Score against description
-            desc_words = set(re.findall(r'\w+', pattern.description.lower()))
             score += len(words & desc_words) * 2
 
             # Score against causes
-            for cause in pattern.causes:
-                cause_words = set(re.findall(r'\w+', cause.lower()))
+            for cause_words in cause_word_sets:
                 score += len(words & cause_words)
 
             if score > 0:
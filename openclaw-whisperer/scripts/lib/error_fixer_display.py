@@ -1,8 +1,10 @@
 """Display helpers for error-fixer CLI output."""
 from __future__ import annotations
 
-from rich.console import Console
-from rich.panel import Panel
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 def display_suggestions(
@@ -21,6 +23,8 @@ def display_suggestions(
         header: Header text
         border_color: Panel border color
     """
+    from rich.panel import Panel
+
     console.print("\n")
     content = []
     content.append(f"[bold {border_color}]{header}[/bold {border_color}]\n")
@@ -59,6 +63,8 @@ def display_integration_suggestions(
         header: Header text
         border_color: Panel border color
     """
+    from rich.panel import Panel
+
     console.print("\n")
     content = []
     content.append(f"[bold {border_color}]{header}[/bold {border_color}]\n")
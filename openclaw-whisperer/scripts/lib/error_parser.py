@@ -4,8 +4,10 @@ from __future__ import annotations
 import json
 import re
 import sys
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
 from .error_extraction_helpers import extract_timestamp, extract_error_code
 
@@ -29,32 +31,53 @@ ERROR_PATTERNS = [
     r'(?i)HTTP\s+([4-5]\d{2})',
 ]
 
+_COMPILED_ERROR_PATTERNS = [re.compile(p) for p in ERROR_PATTERNS]
+
+# Lines of context kept before and after each detected error
+CONTEXT_BEFORE = 2
+CONTEXT_AFTER = 2
+
 
 class ErrorParser:
     """Parser for extracting errors from logs and text."""
 
     def parse_log_file(self, path: Path) -> list[ParsedError]:
         """Parse log file for errors."""
-        errors = []
+        return list(self.iter_log_file(path))
+
+    def iter_log_file(self, path: Path) -> Iterator[ParsedError]:
+        """Stream errors from a log file without reading it into memory.
+
+        Each error is yielded as soon as its trailing context lines have
+        been read, so memory stays bounded regardless of log size.
+        """
         if not path.exists():
-            return errors
+            return
 
         try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-
-            for i, line in enumerate(lines, start=1):
-                error = self._detect_error_line(line, i)
-                if error:
-                    start = max(0, i - 3)
-                    end = min(len(lines), i + 2)
-                    error.context_lines = [lines[j].rstrip() for j in range(start, end)]
-                    errors.append(error)
+            with open(path, 'r', encoding='utf-8', errors='ignore', buffering=1 << 20) as f:
+                recent = deque(maxlen=CONTEXT_BEFORE)
+                pending = deque()  # [error, trailing lines still needed]
+
+                for i, line in enumerate(f, start=1):
+                    stripped = line.rstrip()
+                    for entry in pending:
+                        entry[0].context_lines.append(stripped)
+                        entry[1] -= 1
+                    while pending and pending[0][1] == 0:
+                        yield pending.popleft()[0]
+
+                    error = self._detect_error_line(line, i)
+                    if error:
+                        error.context_lines = [*recent, stripped]
+                        pending.append([error, CONTEXT_AFTER])
+                    recent.append(stripped)
+
+                while pending:
+                    yield pending.popleft()[0]
         except IOError:
             pass
 
-        return errors
-
     def parse_text(self, text: str) -> list[ParsedError]:
         """Parse arbitrary text for errors."""
         errors = []
@@ -99,8 +122,8 @@ class ErrorParser:
 
         timestamp = extract_timestamp(line)
 
-        for pattern in ERROR_PATTERNS:
-            match = re.search(pattern, line)
+        for pattern in _COMPILED_ERROR_PATTERNS:
+            match = pattern.search(line)
             if match:
                 error_code = extract_error_code(line)
                 message = match.group(2) if len(match.groups()) >= 2 else match.group(0)
@@ -1,6 +1,7 @@
 """Auto-fix execution engine for OpenClaw diagnostics."""
 from __future__ import annotations
 
+import functools
 import time
 from dataclasses import dataclass, field
 
@@ -14,6 +15,11 @@ from .recovery_integrations import RecoveryIntegrations, RecoverySuggestion
 @dataclass
 class FixRecipe:
     """Structured fix recipe with execution metadata."""
+    __slots__ = (
+        "id", "title", "safe_auto", "description",
+        "steps", "rollback", "requires_restart",
+    )
+
     id: str
     title: str
     safe_auto: bool
@@ -37,20 +43,40 @@ class FixResult:
 
 
 class FixEngine:
-    """Engine for executing automated fixes."""
+    """Engine for executing automated fixes.
+
+    Recipes and integrations are loaded lazily on first use.
+    """
+
+    @functools.cached_property
+    def recipes(self) -> dict[str, FixRecipe]:
+        """Fix recipes keyed by ID, loaded on first access."""
+        return self._load_recipes()
+
+    @functools.cached_property
+    def diag_integrations(self) -> DiagnosticIntegrations:
+        """Diagnostic skill integrations, loaded on first access."""
+        return DiagnosticIntegrations()
 
-    def __init__(self):
-        """Initialize and load fix recipes from JSON."""
-        self.recipes: dict[str, FixRecipe] = {}
-        self.diag_integrations = DiagnosticIntegrations()
-        self.recovery_integrations = RecoveryIntegrations()
-        self._load_recipes()
+    @functools.cached_property
+    def recovery_integrations(self) -> RecoveryIntegrations:
+        """Recovery skill integrations, loaded on first access."""
+        return RecoveryIntegrations()
 
-    def _load_recipes(self) -> None:
+    @functools.cached_property
+    def _safe(self) -> tuple[FixRecipe, ...]:
+        """Recipes with safe_auto=True."""
+        return tuple(r for r in self.recipes.values() if r.safe_auto)
+
+    @functools.cached_property
+    def _can_auto_fix(self) -> frozenset[str]:
+        """IDs of recipes with safe_auto=True."""
+        return frozenset(r.id for r in self._safe)
+
+    def _load_recipes(self) -> dict[str, FixRecipe]:
         """Load fix recipes from data/fix-recipes.json."""
         data = load_json(DATA_DIR / "fix-recipes.json")
-        if data:
-            self.recipes = self._parse_recipes(data)
+        return self._parse_recipes(data) if data else {}
 
     def _parse_recipes(self, data: dict) -> dict[str, FixRecipe]:
         """Convert JSON data to FixRecipe instances."""
@@ -77,8 +103,7 @@ class FixEngine:
 
     def can_auto_fix(self, recipe_id: str) -> bool:
         """Check if recipe is safe for auto-execution."""
-        recipe = self.get_recipe(recipe_id)
-        return recipe.safe_auto if recipe else False
+        return recipe_id in self._can_auto_fix
 
     def execute(
         self,
@@ -141,9 +166,9 @@ class FixEngine:
 
         return result
 
-    def list_safe_recipes(self) -> list[FixRecipe]:
+    def list_safe_recipes(self) -> tuple[FixRecipe, ...]:
         """Get all recipes with safe_auto=True."""
-        return [r for r in self.recipes.values() if r.safe_auto]
+        return self._safe
 
     def list_all_recipes(self) -> list[FixRecipe]:
         """Get all recipes."""
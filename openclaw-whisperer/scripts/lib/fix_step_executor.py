@@ -1,6 +1,7 @@
 """Step execution logic for the fix engine."""
 from __future__ import annotations
 
+import copy
 import shlex
 from pathlib import Path
 
@@ -74,7 +75,9 @@ def _execute_config_set_step(step: dict, dry_run: bool, params: dict) -> tuple[b
     if dry_run:
         return True, f"Would set config {key}={value}"
 
-    config = get_config() or {}
+    # get_config() hands out a shared cached dict; edit a copy so a failed
+    # save leaves it untouched
+    config = copy.deepcopy(get_config() or {})
     keys = key.split(".")
     current = config
     for k in keys[:-1]:
@@ -1,10 +1,11 @@
 """Recommendation engine for ClawHub skills."""
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 
 from .clawhub_client import ClawHubClient, SkillInfo
-from .config_analyzer import ConfigAnalyzer
+from .config_analyzer import get_default_analyzer
 from .complementary_skills import ComplementarySkillScorer
 from .recommendation_scoring import score_skill
 
@@ -12,6 +13,8 @@ from .recommendation_scoring import score_skill
 @dataclass
 class Recommendation:
     """Skill recommendation with score and reason."""
+    __slots__ = ("skill", "score", "reasons")
+
     skill: SkillInfo
     score: float
     reasons: list[str]
@@ -23,7 +26,7 @@ class RecommendationEngine:
     def __init__(self):
         """Initialize recommendation engine."""
         self.client = ClawHubClient()
-        self.analyzer = ConfigAnalyzer()
+        self.analyzer = get_default_analyzer()
         self.comp_scorer = ComplementarySkillScorer()
 
     def recommend(
@@ -58,11 +61,24 @@ class RecommendationEngine:
         # Search skills
         skills = self.client.search(query, limit=top * 2)
 
+        return self._rank(skills, channel, use_case, installed, top)
+
+    def _rank(
+        self,
+        skills: list[SkillInfo],
+        channel: str | None,
+        use_case: str | None,
+        installed: list[str],
+        top: int
+    ) -> list[Recommendation]:
+        """Score candidate skills and return the top-ranked recommendations."""
+        installed_set = set(installed)
+
         # Score and filter
         recommendations = []
         for skill in skills:
             # Skip already installed skills
-            if skill.slug in installed:
+            if skill.slug in installed_set:
                 continue
 
             score, reasons = score_skill(
@@ -75,9 +91,8 @@ class RecommendationEngine:
                     reasons=reasons
                 ))
 
-        # Sort by score descending
-        recommendations.sort(key=lambda r: r.score, reverse=True)
-        return recommendations[:top]
+        # Top-k by score descending (stable, like a full sort + slice)
+        return heapq.nlargest(top, recommendations, key=lambda r: r.score)
 
     def suggest_for_config(self) -> list[Recommendation]:
         """
@@ -90,11 +105,15 @@ class RecommendationEngine:
         if not enabled_channels:
             return []
 
+        # One installed-skills lookup and one batched search for all channels
+        installed = [s.slug for s in self.client.list_installed()]
+        results = self.client.multi_search(enabled_channels, limit=10)
+
         all_recommendations = []
         seen_slugs = set()
 
         for channel in enabled_channels:
-            recs = self.recommend(channel=channel, top=5)
+            recs = self._rank(results.get(channel, []), channel, None, installed, 5)
             for rec in recs:
                 if rec.skill.slug not in seen_slugs:
                     all_recommendations.append(rec)
@@ -111,15 +130,15 @@ class RecommendationEngine:
         Returns:
             List of (installed_skill, latest_skill) tuples needing update
         """
-        installed = self.client.list_installed()
-        updates_available = []
-
-        for installed_skill in installed:
-            latest = self.client.get_skill_info(installed_skill.slug)
-            if latest and latest.version != installed_skill.version:
-                updates_available.append((installed_skill, latest))
-
-        return updates_available
+        installed_by_slug = {s.slug: s for s in self.client.list_installed()}
+        latest_by_slug = self.client.get_skill_info_many(list(installed_by_slug))
+
+        updates = []
+        for slug, installed in installed_by_slug.items():
+            latest = latest_by_slug.get(slug)
+            if latest is not None and latest.version != installed.version:
+                updates.append((installed, latest))
+        return updates
 
     def suggest_complementary(
         self,
@@ -1,29 +1,51 @@
 """Scoring constants and logic for skill recommendations."""
 from __future__ import annotations
 
+import functools
+
 from .clawhub_client import SkillInfo
 
 
 # Channel-skill affinity mapping
 CHANNEL_SKILLS = {
-    "whatsapp": ["whatsapp-media", "whatsapp-status", "qr-code-gen"],
-    "telegram": ["telegram-inline", "telegram-webhooks", "image-gen"],
-    "discord": ["discord-voice", "discord-slash", "game-stats"],
-    "slack": ["slack-workflows", "slack-apps", "jira-integration"],
-    "signal": ["signal-groups", "privacy-tools"],
-    "teams": ["teams-meetings", "sharepoint-integration"],
+    "whatsapp": ("whatsapp-media", "whatsapp-status", "qr-code-gen"),
+    "telegram": ("telegram-inline", "telegram-webhooks", "image-gen"),
+    "discord": ("discord-voice", "discord-slash", "game-stats"),
+    "slack": ("slack-workflows", "slack-apps", "jira-integration"),
+    "signal": ("signal-groups", "privacy-tools"),
+    "teams": ("teams-meetings", "sharepoint-integration"),
 }
 
 # Use case keywords
 USE_CASE_KEYWORDS = {
-    "calendar": ["calendar", "schedule", "meeting", "event", "reminder"],
-    "image": ["image", "photo", "picture", "vision", "ocr", "generation"],
-    "code": ["code", "github", "gitlab", "deploy", "ci/cd"],
-    "automation": ["workflow", "automation", "task", "schedule"],
-    "analytics": ["analytics", "metrics", "stats", "dashboard"],
+    "calendar": ("calendar", "schedule", "meeting", "event", "reminder"),
+    "image": ("image", "photo", "picture", "vision", "ocr", "generation"),
+    "code": ("code", "github", "gitlab", "deploy", "ci/cd"),
+    "automation": ("workflow", "automation", "task", "schedule"),
+    "analytics": ("analytics", "metrics", "stats", "dashboard"),
 }
 
 
+@functools.lru_cache(maxsize=32)
+def _match_terms(
+    channel: str | None,
+    use_case: str | None
+) -> tuple[str | None, tuple[str, ...], str | None, tuple[str, ...]]:
+    """Resolve lowercased match terms for a channel/use-case query.
+
+    Scoring is called once per candidate skill with the same filters, so
+    the lookups are resolved once per query rather than once per skill.
+
+    Returns:
+        Tuple of (channel_lower, channel_slugs, use_case_lower, keywords)
+    """
+    channel_lower = channel.lower() if channel else None
+    channel_slugs = CHANNEL_SKILLS.get(channel_lower, ()) if channel_lower else ()
+    use_case_lower = use_case.lower() if use_case else None
+    keywords = USE_CASE_KEYWORDS.get(use_case_lower, (use_case_lower,)) if use_case_lower else ()
+    return channel_lower, channel_slugs, use_case_lower, keywords
+
+
 def score_skill(
     skill: SkillInfo,
     channel: str | None,
@@ -45,6 +67,7 @@ def score_skill(
     """
     score = 0.0
     reasons = []
+    channel_lower, channel_slugs, use_case_lower, keywords = _match_terms(channel, use_case)
 
     # Base score from verification and downloads
     if skill.verified:
@@ -59,31 +82,26 @@ def score_skill(
 
     # Channel affinity
     if channel:
-        channel_lower = channel.lower()
-        if channel_lower in CHANNEL_SKILLS:
-            if any(s in skill.slug for s in CHANNEL_SKILLS[channel_lower]):
-                score += 3.0
-                reasons.append(f"Optimized for {channel}")
+        if any(s in skill.slug for s in channel_slugs):
+            score += 3.0
+            reasons.append(f"Optimized for {channel}")
 
-        if channel_lower in skill.name.lower() or channel_lower in skill.description.lower():
+        if channel_lower in skill.name_lower or channel_lower in skill.description_lower:
             score += 2.0
             reasons.append(f"Matches {channel} channel")
 
     # Use case matching
     if use_case:
-        use_case_lower = use_case.lower()
-        keywords = USE_CASE_KEYWORDS.get(use_case_lower, [use_case_lower])
-        desc_lower = skill.description.lower()
-        matches = sum(1 for kw in keywords if kw in desc_lower)
+        matches = sum(1 for kw in keywords if kw in skill.description_lower)
         if matches > 0:
             score += matches * 1.5
             reasons.append(f"Matches '{use_case}' use case")
 
     # Tag matching
-    if skill.tags:
-        if channel and channel.lower() in [t.lower() for t in skill.tags]:
+    if skill.tags_lower:
+        if channel and channel_lower in skill.tags_lower:
             score += 1.0
-        if use_case and use_case.lower() in [t.lower() for t in skill.tags]:
+        if use_case and use_case_lower in skill.tags_lower:
             score += 1.0
 
     # Complementary skill bonus
@@ -1,15 +1,20 @@
 """Shared utility functions for OpenClaw Doctor Pro."""
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
+import stat
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
 
 # Path constants
 OPENCLAW_DIR = Path.home() / ".openclaw"
@@ -22,8 +27,18 @@ SKILL_DIR = Path(__file__).parent.parent.parent
 DATA_DIR = SKILL_DIR / "data"
 REFERENCES_DIR = SKILL_DIR / "references"
 
-# Rich console instance
-console = Console()
+# Rich console instance, created on first use so JSON-only paths skip
+# the cost of importing rich
+_console: Console | None = None
+
+
+def get_console() -> Console:
+    """Return the shared Rich console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 def check_mark(ok: bool) -> str:
@@ -49,17 +64,64 @@ def load_json(path: Path) -> dict | None:
     try:
         if not path.exists():
             return None
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json.loads(path.read_bytes())
     except (json.JSONDecodeError, IOError) as e:
-        console.print(f"[yellow]Warning: Failed to load {path}: {e}[/yellow]")
+        get_console().print(f"[yellow]Warning: Failed to load {path}: {e}[/yellow]")
         return None
 
 
+def print_json(data) -> None:
+    """
+    Write data to stdout as indented JSON.
+
+    Bypasses Rich's JSON highlighting and layout, which dominates runtime
+    for large outputs; the text matches console.print_json() when piped.
+
+    Args:
+        data: JSON-serializable data
+    """
+    sys.stdout.write(json.dumps(data, indent=2, ensure_ascii=False))
+    sys.stdout.write("\n")
+
+
+def print_json_stream(items) -> int:
+    """
+    Write an iterable to stdout as an indented JSON array, item by item.
+
+    Produces the same text as print_json(list(items)) without holding the
+    whole list in memory. Nothing is written for an empty iterable.
+
+    Args:
+        items: Iterable of JSON-serializable values
+
+    Returns:
+        Number of items written
+    """
+    count = 0
+    for item in items:
+        sys.stdout.write("[\n  " if count == 0 else ",\n  ")
+        sys.stdout.write(json.dumps(item, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+        count += 1
+    if count:
+        sys.stdout.write("\n]\n")
+    return count
+
+
+def _current_umask() -> int:
+    """Return the process umask without changing it."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
 def save_json(path: Path, data: dict) -> bool:
     """
     Safely save JSON file.
 
+    Writes to a temporary sibling file and renames it over the target, so
+    a crash mid-write never leaves a truncated file behind. Symlinks are
+    followed and the existing file's permissions are preserved.
+
     Args:
         path: Path to save JSON file
         data: Dictionary to save
@@ -67,20 +129,50 @@ def save_json(path: Path, data: dict) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    target = path.resolve()
+    tmp_path = None
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        text = json.dumps(data, indent=2)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp name, so concurrent writers never share one
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # mkstemp creates the file 0600; give it the target's mode, or the
+        # one a plain open() would have used
+        if target.exists():
+            mode = stat.S_IMODE(target.stat().st_mode)
+        else:
+            mode = 0o666 & ~_current_umask()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
         return True
-    except (IOError, TypeError) as e:
-        console.print(f"[red]Error: Failed to save {path}: {e}[/red]")
+    except (IOError, TypeError, ValueError) as e:
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        get_console().print(f"[red]Error: Failed to save {path}: {e}[/red]")
         return False
+    finally:
+        # Drop the cached config and the analyzer built from it so the
+        # next get_config() / get_default_analyzer() sees the write
+        if path == CONFIG_FILE:
+            get_config.cache_clear()
+            from .config_analyzer import reset_default_analyzer
+            reset_default_analyzer()
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> dict | None:
     """
     Load OpenClaw configuration file.
 
+    The parsed config is cached for the lifetime of the process; call
+    get_config.cache_clear() to force a reload from disk.
+
     Returns:
         Configuration dict or None if not found
     """
@@ -140,4 +232,6 @@ def format_panel(title: str, content: str, style: str = "blue") -> Panel:
     Returns:
         Rich Panel instance
     """
+    from rich.panel import Panel
+
     return Panel(content, title=title, border_style=style)
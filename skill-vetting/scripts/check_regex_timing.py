@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Timing check for the prompt-injection patterns in scan.py
+Runs each pattern, its category gate and a full scan over pathological
+inputs and fails if any takes longer than the time budget
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scan import SkillScanner
+
+
+def pathological_inputs(size: int) -> dict:
+    """Single-line inputs of about size characters that stress the gaps"""
+    def fill(unit: str, prefix: str = '') -> str:
+        return prefix + unit * ((size - len(prefix)) // len(unit))
+
+    return {
+        'html comment, filler': fill('a', '<!-- '),
+        'markdown link, filler': fill('a', '['),
+        'repeated html opener+trigger': fill('<!--ignore '),
+        'repeated markdown opener+trigger': fill('[ignore '),
+        'html opener, repeated triggers': fill('ignore', '<!--'),
+        'markdown opener, repeated triggers': fill('forget', '['),
+        'html opener, nested tags': fill('<ignore ', '<!--'),
+        'repeated comment headings': fill('#' + 'a' * 498 + '\n'),
+    }
+
+
+def timed(fn) -> float:
+    """Seconds taken by one call of fn"""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def scan_as_doc(text: str):
+    """Scan text as the only file of a skill, as a markdown doc"""
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / 'SKILL.md').write_text(text, encoding='utf-8')
+        SkillScanner(tmp).scan()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check prompt-injection pattern timing on pathological inputs')
+    parser.add_argument('--size', type=int, default=256 * 1024, help='Input size in characters')
+    parser.add_argument('--budget', type=float, default=1.0, help='Maximum seconds per check')
+    args = parser.parse_args()
+
+    checks = []
+    for name, text in pathological_inputs(args.size).items():
+        raw = text.encode()
+        for pid in SkillScanner.DOC_PATTERN_IDS:
+            for kind, content, compiled in (('str', text, SkillScanner.PATTERNS),
+                                            ('bytes', raw, SkillScanner.BYTES_PATTERNS)):
+                rx, _, desc = compiled[pid]
+                checks.append((f"{name} / {desc} ({kind})", lambda rx=rx, c=content: sum(1 for _ in rx.finditer(c))))
+        for kind, content, gates in (('str', text, SkillScanner.CATEGORY_GATES),
+                                     ('bytes', raw, SkillScanner.BYTES_CATEGORY_GATES)):
+            gate = gates['prompt_injection']
+            checks.append((f"{name} / category gate ({kind})", lambda g=gate, c=content: g.search(c)))
+        checks.append((f"{name} / full scan", lambda t=text: scan_as_doc(t)))
+
+    failed = 0
+    for label, fn in checks:
+        elapsed = timed(fn)
+        ok = elapsed <= args.budget
+        failed += not ok
+        print(f"{'ok  ' if ok else 'SLOW'} {elapsed:7.3f}s  {label}")
+
+    print(f"\n{len(checks) - failed}/{len(checks)} checks within {args.budget}s")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
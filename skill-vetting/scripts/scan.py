@@ -8,79 +8,478 @@ import os
 import re
 import sys
 import json
+import locale
 import argparse
 import base64
+import array
+import hashlib
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import hyperscan  # optional: accelerates the per-category gates
+except ImportError:
+    hyperscan = None
+
+# Whitelist to reduce false positives, checked against the matched line:
+# lines starting (after indentation) with a comment or docstring marker,
+# and lines mentioning a local-only address
+WHITELIST_PREFIXES = ('#', '"""', "'''")
+WHITELIST_SUBSTRINGS = ('localhost', '127.0.0.1')
+
+# Dangerous patterns to detect
+_RAW_PATTERNS = {
+    'code_execution': [
+        (r'\beval\s*\(', 'eval() execution'),
+        (r'\bexec\s*\(', 'exec() execution'),
+        (r'__import__\s*\(', 'dynamic imports'),
+        (r'compile\s*\(', 'code compilation'),
+    ],
+    'subprocess': [
+        (r'subprocess\.(call|run|Popen).*shell\s*=\s*True', 'shell=True'),
+        (r'os\.system\s*\(', 'os.system()'),
+        (r'os\.popen\s*\(', 'os.popen()'),
+        (r'commands\.(getoutput|getstatusoutput)', 'commands module'),
+    ],
+    'obfuscation': [
+        (r'base64\.b64decode', 'base64 decoding'),
+        (r'codecs\.decode.*[\'"]hex[\'"]', 'hex decoding'),
+        (r'\\x[0-9a-fA-F]{2}', 'hex escapes'),
+        (r'\\u[0-9a-fA-F]{4}', 'unicode escapes'),
+        (r'chr\s*\(\s*\d+\s*\)', 'chr() obfuscation'),
+    ],
+    'network': [
+        (r'requests\.(get|post|put|delete)\s*\(', 'HTTP requests'),
+        (r'urllib\.request\.urlopen', 'urllib requests'),
+        (r'socket\.socket\s*\(', 'raw sockets'),
+        (r'http\.client\.(HTTPConnection|HTTPSConnection)', 'http.client'),
+    ],
+    'file_operations': [
+        (r'open\s*\(.*[\'"]w[\'"]', 'file writing'),
+        (r'os\.remove\s*\(', 'file deletion'),
+        (r'shutil\.(rmtree|move|copy)', 'bulk file ops'),
+        (r'pathlib\.Path.*\.unlink\s*\(', 'path deletion'),
+    ],
+    'env_access': [
+        (r'os\.environ\[', 'env variable access'),
+        (r'os\.getenv\s*\(', 'env variable reading'),
+        (r'subprocess.*env\s*=', 'env manipulation'),
+    ],
+    # Gaps are bounded ([^\n] is what . matched) so adversarial long lines
+    # can't drive the backtracking engine superlinear. The first gap also
+    # stops at the next opener, so each start scans its own span: a line
+    # matches exactly when it did with an unrestricted gap, via the last
+    # opener before the trigger word.
+    'prompt_injection': [
+        (r'<!--(?:[^\n<]|<(?!!--)){0,500}(?:ignore|disregard|forget)[^\n]{0,500}instruction',
+         'hidden instructions (HTML)'),
+        (r'\[[^\n\[]{0,500}(?:ignore|disregard|forget)[^\n]{0,500}instruction', 'hidden instructions (markdown)'),
+        (r'(?:^|\n)#[^\n]{0,500}(?:system|assistant|user):', 'role manipulation in comments'),
+    ],
+}
+
+# Hyperscan has no lookaround, so its gate database gets these patterns in
+# place of the ones above; each matches on exactly the same lines, and
+# Hyperscan doesn't backtrack, so the unrestricted gap costs it nothing
+_HYPERSCAN_EQUIVALENTS = {
+    _RAW_PATTERNS['prompt_injection'][0][0]:
+        r'<!--[^\n]{0,500}(?:ignore|disregard|forget)[^\n]{0,500}instruction',
+}
+
+# Flat pattern ids: (category, description) per id, in PATTERNS order, and
+# the id of each category's first pattern. A finding is stored compactly as
+# a (pattern id, line, match) row.
+_PATTERN_META: List[Tuple[str, str]] = []
+_PATTERN_BASE: Dict[str, int] = {}
+for _cat, _lst in _RAW_PATTERNS.items():
+    _PATTERN_BASE[_cat] = len(_PATTERN_META)
+    _PATTERN_META.extend((_cat, desc) for _, desc in _lst)
+del _cat, _lst
+Row = Tuple[int, int, str]
+
+# Encoding Path.read_text() would use when none is given
+_ENCODING = locale.getpreferredencoding(False)
+
+# Control characters that str \s matches but bytes \s (and Hyperscan) do not
+_STR_ONLY_SPACE = re.compile(rb'[\x1c-\x1f]')
+
+
+def _compile_patterns(kind: type) -> Tuple[Tuple[re.Pattern, str, str], ...]:
+    """Compile _RAW_PATTERNS as flat (regex, category, description) entries.
+
+    Entries are indexed by pattern id; kind selects str or bytes regexes.
+    """
+    encode = str.encode if kind is bytes else str
+    return tuple(
+        (re.compile(encode(p), re.IGNORECASE | re.MULTILINE), cat, desc)
+        for cat, lst in _RAW_PATTERNS.items() for p, desc in lst
+    )
+
+
+def _compile_gates(kind: type) -> Dict[str, re.Pattern]:
+    """Compile one alternation of all patterns per category, as str or bytes"""
+    encode = str.encode if kind is bytes else str
+    return {
+        cat: re.compile(encode('|'.join(f'(?:{p})' for p, _ in lst)), re.IGNORECASE | re.MULTILINE)
+        for cat, lst in _RAW_PATTERNS.items()
+    }
+
+
+def _build_hyperscan_db():
+    """Compile every pattern into one Hyperscan block-mode database.
+
+    Returns (database, category per pattern id), or (None, None) when
+    Hyperscan is not installed or rejects a pattern.
+    """
+    if hyperscan is None:
+        return None, None
+    flat = [(cat, p) for cat, lst in _RAW_PATTERNS.items() for p, _ in lst]
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[_HYPERSCAN_EQUIVALENTS.get(p, p).encode() for _, p in flat],
+            ids=list(range(len(flat))),
+            elements=len(flat),
+            flags=[flags] * len(flat),
+        )
+    except hyperscan.error:
+        return None, None
+    return db, [cat for cat, _ in flat]
+
+
+def _iter_windows(path: str, chunk_size: int, overlap: int, hasher=None) -> Iterator[Tuple[bytes, int]]:
+    """Read a file as (window, owned) pairs of newline-normalized bytes.
+
+    Windows start on a line boundary. Each owns its first `owned` bytes,
+    which end on a line boundary at least `chunk_size` in, and carries
+    whole lines up to at least `overlap` bytes past that, so any match
+    starting in the owned region can complete. Newlines are translated
+    as read_text() does, including \r\n split across reads. A hashlib
+    object given as hasher is fed the file's bytes as they are read.
+    """
+    buf = b''
+    eof = False
+    pending_cr = False
+
+    def fill() -> bool:
+        nonlocal buf, eof, pending_cr
+        block = f.read(chunk_size)
+        if hasher is not None:
+            hasher.update(block)
+        if not block:
+            eof = True
+            if pending_cr:
+                buf += b'\n'
+                pending_cr = False
+            return False
+        if pending_cr:
+            block = b'\r' + block
+        pending_cr = block.endswith(b'\r')
+        if pending_cr:
+            block = block[:-1]
+        if b'\r' in block:
+            block = block.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        buf += block
+        return True
+
+    def line_end(pos: int) -> int:
+        # Offset just past the first newline at or after pos (or end of file)
+        while True:
+            i = buf.find(b'\n', pos)
+            if i != -1:
+                return i + 1
+            if eof or not fill():
+                return len(buf)
+
+    with open(path, 'rb') as f:
+        while True:
+            while len(buf) < chunk_size + overlap and fill():
+                pass
+            if eof and len(buf) <= chunk_size + overlap:
+                if buf:
+                    yield buf, len(buf)
+                return
+            owned = line_end(chunk_size - 1)
+            end = line_end(owned + overlap - 1)
+            yield buf[:end], owned
+            buf = buf[owned:]
+
+
+def _is_whitelisted(line: str) -> bool:
+    """Check whether a matched line falls under the whitelist"""
+    return (line.lstrip().startswith(WHITELIST_PREFIXES)
+            or any(sub in line for sub in WHITELIST_SUBSTRINGS))
+
+
+def _read_small(path: str, limit: int, digest: bool = False) -> Tuple[Optional[bytes], Optional[str]]:
+    """Read a whole file of at most limit bytes.
+
+    Returns (data, digest): data is None if the file is larger or
+    unreadable, and digest is the content digest of data when requested.
+    """
+    try:
+        with open(path, 'rb') as f:
+            # Skip reading files already known to be too large; the read
+            # still checks, in case the file grew since
+            if os.fstat(f.fileno()).st_size > limit:
+                return None, None
+            data = f.read(limit + 1)
+    except OSError:
+        return None, None
+    if len(data) > limit:
+        return None, None
+    return data, _new_digest(data).hexdigest() if digest else None
+
+
+def _new_digest(data: bytes = b''):
+    """blake2b hasher used for findings cache content keys"""
+    return hashlib.blake2b(data, digest_size=16)
+
+
+# Extensions (lowercased, without the dot) of files worth scanning as text
+_TEXT_EXT = frozenset({'py', 'md', 'txt', 'sh', 'bash', 'js', 'json', 'yaml', 'yml', 'toml'})
+
+
+def _extension(name: str) -> str:
+    """Lowercased extension of a file name without the dot, as Path.suffix
+    would find it ('' for no extension, dotfiles and trailing dots)"""
+    stem, _, ext = name.rpartition('.')
+    return ext.lower() if stem else ''
+
+
+# Persistent findings cache shared across runs (see FindingsCache)
+CACHE_FILE = Path.home() / '.cache' / 'claw-scanner' / 'findings.json'
+# Bump when scanning logic changes in a way the patterns alone don't capture
+CACHE_VERSION = 3
+
+
+class FindingsCache:
+    """Per-file findings keyed by content hash, persisted as JSON.
+
+    Finding rows are stored under the blake2b digest of a file's bytes (plus
+    whether it was scanned as a doc), independent of its path, so moved or
+    copied files hit too. A path -> (mtime, size, inode, ctime, key) table
+    lets unchanged files skip reading altogether; other files are hashed
+    from the bytes the scan reads anyway. Entries are kept in
+    least-recently-used order and the whole cache is dropped when the
+    pattern signature changes.
+    """
+
+    MAX_ENTRIES = 20000
+
+    def __init__(self, path: Path, files: Dict[str, list], findings: Dict[str, list]):
+        self.path = path
+        self.files = files
+        self.findings = findings
+        self.dirty = False
+        # Stat identity of each file looked up, held until store()
+        self._pending: Dict[str, list] = {}
+
+    @staticmethod
+    def signature() -> str:
+        """Fingerprint of everything that determines a file's findings"""
+        spec = repr((CACHE_VERSION, _ENCODING, _RAW_PATTERNS, WHITELIST_PREFIXES, WHITELIST_SUBSTRINGS))
+        return hashlib.blake2b(spec.encode(), digest_size=16).hexdigest()
+
+    @classmethod
+    def load(cls, path: Path) -> 'FindingsCache':
+        """Load the cache at path, starting empty if missing, corrupt or stale"""
+        try:
+            data = json.loads(path.read_bytes())
+            if data.get('signature') == cls.signature():
+                return cls(path, data['files'], data['findings'])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return cls(path, {}, {})
+
+    def lookup(self, file_path: str) -> Optional[List[Row]]:
+        """Return cached finding rows for an unchanged file, or None on a miss.
+
+        Only stats the file; on a miss the caller scans it, computing the
+        content key from the bytes it reads, and passes that to store().
+        """
+        file_path = os.path.abspath(file_path)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        # ctime can't be set from user space, so a rewrite that restores the
+        # old mtime (utime, touch -r, tar) still changes the identity. The
+        # identity is taken before the scan reads the file, so a change
+        # racing with the scan only causes a rescan next time.
+        ident = [st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns]
+        self._pending[file_path] = ident
+        entry = self.files.get(file_path)
+        if not entry or entry[:-1] != ident:
+            return None
+        # Re-inserting keeps the most recently used entries last
+        self.files[file_path] = self.files.pop(file_path)
+        return self.rows_for(entry[-1])
+
+    def rows_for(self, key: str) -> Optional[List[Row]]:
+        """Return cached finding rows for a content key, or None"""
+        rows = self.findings.pop(key, None)
+        if rows is None:
+            return None
+        self.findings[key] = rows
+        return [tuple(row) for row in rows]
+
+    def store(self, file_path: str, key: str, rows: List[Row]):
+        """Record finding rows under key for a file previously passed to lookup()"""
+        file_path = os.path.abspath(file_path)
+        ident = self._pending.pop(file_path, None)
+        if ident is None:
+            return
+        self.files.pop(file_path, None)
+        self.files[file_path] = ident + [key]
+        self.findings.pop(key, None)
+        self.findings[key] = rows
+        self.dirty = True
+
+    @staticmethod
+    def content_key(digest: str, is_doc: bool) -> str:
+        """Findings key for file content with the given digest"""
+        return ('doc:' if is_doc else 'code:') + digest
+
+    def save(self):
+        """Atomically write the cache back, trimming the oldest entries"""
+        if not self.dirty:
+            return
+        for table in (self.files, self.findings):
+            for key in list(table)[:max(0, len(table) - self.MAX_ENTRIES)]:
+                del table[key]
+        data = {'signature': self.signature(), 'files': self.files, 'findings': self.findings}
+        tmp_name = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per run, so concurrent scans never write
+            # into each other's; the last one to finish wins
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_name, self.path)
+        except OSError as e:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+            print(f"Warning: Could not save findings cache {self.path}: {e}", file=sys.stderr)
+
 
 class SkillScanner:
     """Scan skill files for security issues"""
 
-    # Whitelist patterns to reduce false positives
-    WHITELIST = [
-        r'^\s*#',       # Comments
-        r'^\s*"""',      # Docstrings
-        r"^\s*'''",      # Docstrings
-        r'localhost|127\.0\.0\.1',  # Local only
-    ]
-
-    # Dangerous patterns to detect
-    PATTERNS = {
-        'code_execution': [
-            (r'\beval\s*\(', 'eval() execution'),
-            (r'\bexec\s*\(', 'exec() execution'),
-            (r'__import__\s*\(', 'dynamic imports'),
-            (r'compile\s*\(', 'code compilation'),
-        ],
-        'subprocess': [
-            (r'subprocess\.(call|run|Popen).*shell\s*=\s*True', 'shell=True'),
-            (r'os\.system\s*\(', 'os.system()'),
-            (r'os\.popen\s*\(', 'os.popen()'),
-            (r'commands\.(getoutput|getstatusoutput)', 'commands module'),
-        ],
-        'obfuscation': [
-            (r'base64\.b64decode', 'base64 decoding'),
-            (r'codecs\.decode.*[\'"]hex[\'"]', 'hex decoding'),
-            (r'\\x[0-9a-fA-F]{2}', 'hex escapes'),
-            (r'\\u[0-9a-fA-F]{4}', 'unicode escapes'),
-            (r'chr\s*\(\s*\d+\s*\)', 'chr() obfuscation'),
-        ],
-        'network': [
-            (r'requests\.(get|post|put|delete)\s*\(', 'HTTP requests'),
-            (r'urllib\.request\.urlopen', 'urllib requests'),
-            (r'socket\.socket\s*\(', 'raw sockets'),
-            (r'http\.client\.(HTTPConnection|HTTPSConnection)', 'http.client'),
-        ],
-        'file_operations': [
-            (r'open\s*\(.*[\'"]w[\'"]', 'file writing'),
-            (r'os\.remove\s*\(', 'file deletion'),
-            (r'shutil\.(rmtree|move|copy)', 'bulk file ops'),
-            (r'pathlib\.Path.*\.unlink\s*\(', 'path deletion'),
-        ],
-        'env_access': [
-            (r'os\.environ\[', 'env variable access'),
-            (r'os\.getenv\s*\(', 'env variable reading'),
-            (r'subprocess.*env\s*=', 'env manipulation'),
-        ],
-        'prompt_injection': [
-            (r'<!--.*(?:ignore|disregard|forget).*instruction', 'hidden instructions (HTML)'),
-            (r'\[.*(?:ignore|disregard|forget).*instruction', 'hidden instructions (markdown)'),
-            (r'(?:^|\n)#.*(?:system|assistant|user):', 'role manipulation in comments'),
-        ],
-    }
-    
-    def __init__(self, skill_path: str):
+    # Compiled once at import as str and bytes regexes, flattened so the
+    # scan loop walks one tuple of (regex, category, description) by id
+    PATTERNS = _compile_patterns(str)
+    BYTES_PATTERNS = _compile_patterns(bytes)
+    PATTERN_IDS = range(len(PATTERNS))
+    # Doc files (.md/.rst/.txt) are only checked for prompt injection
+    DOC_EXTENSIONS = frozenset({'md', 'rst', 'txt'})
+    DOC_PATTERN_IDS = range(
+        _PATTERN_BASE['prompt_injection'],
+        _PATTERN_BASE['prompt_injection'] + len(_RAW_PATTERNS['prompt_injection']),
+    )
+    # One alternation per category: a single pass rules out categories with
+    # no hit. Individual patterns still run on a hit so overlapping findings
+    # from different patterns are all reported, starting at the first hit.
+    CATEGORY_GATES = _compile_gates(str)
+    BYTES_CATEGORY_GATES = _compile_gates(bytes)
+    # Lowercase literals at least one of which every pattern needs to match;
+    # files containing none of them (after ASCII lowercasing) skip the regexes
+    PREFILTER_TOKENS = (
+        b'eval', b'exec', b'__import__', b'compile', b'subprocess', b'os.system',
+        b'os.popen', b'commands.', b'base64', b'codecs', b'\\x', b'\\u', b'chr',
+        b'requests.', b'urllib', b'socket', b'http.client', b'open', b'os.remove',
+        b'shutil.', b'pathlib', b'os.environ', b'os.getenv', b'<!--', b'[', b'#',
+    )
+    DOC_PREFILTER_TOKENS = (b'<!--', b'[', b'#')
+    # Every prompt_injection pattern needs one of these (lowercased) words
+    PROMPT_TRIGGERS = (b'ignore', b'disregard', b'forget', b'system:', b'assistant:', b'user:')
+    # UTF-8 for the non-ASCII letters re.IGNORECASE folds onto ASCII ones
+    # (İ, ı, ſ, K); a file containing any of them always gets the full scan
+    CASEFOLD_BYTES = (b'\xc4\xb0', b'\xc4\xb1', b'\xc5\xbf', b'\xe2\x84\xaa')
+    # All patterns in one Hyperscan database, when the library is available
+    HYPERSCAN_DB, HYPERSCAN_CATEGORIES = _build_hyperscan_db()
+    # Files are read in windows of about this many bytes, each extended to
+    # whole lines plus an overlap so matches crossing a boundary stay intact
+    STREAM_CHUNK_SIZE = 64 * 1024
+    STREAM_OVERLAP = 4 * 1024
+    # Categories weighted as critical in the risk score
+    CRITICAL_CATEGORIES = frozenset({'code_execution', 'subprocess', 'prompt_injection'})
+    # Sequential scans read this many files ahead on READ_THREADS threads
+    READ_AHEAD = 16
+    READ_THREADS = 8
+    # Below this many files, process start-up costs more than it saves
+    PARALLEL_MIN_FILES = 200
+
+    def __init__(self, skill_path: str, cache_path: Optional[Path] = None):
         self.skill_path = Path(skill_path)
-        self.findings: List[Dict] = []
+        # Walked paths are str(skill_path) joined with the relative path
+        root = str(self.skill_path)
+        self._root_len = len(root) if root.endswith(os.sep) else len(root) + 1
+        # Findings are stored column-wise and only turned into dicts on
+        # access: relative path index, line, pattern id and match text
+        self._files: List[str] = []
+        self._f_file = array.array('I')
+        self._f_line = array.array('I')
+        self._f_pattern = array.array('H')
+        self._f_match: List[str] = []
+        self._findings: Optional[List[Dict]] = None
+        # Persistent per-file findings cache; None disables caching
+        self.cache_path = cache_path
+        # Set by scan() once findings are final
+        self._risk_score: Optional[int] = None
 
     @property
     def risk_score(self) -> int:
-        """Calculate risk score (0-100)"""
-        critical = {'code_execution', 'subprocess', 'prompt_injection'}
-        crit_cnt = sum(1 for f in self.findings if f['category'] in critical)
-        warn_cnt = sum(1 for f in self.findings if f['category'] not in critical)
+        """Risk score (0-100), computed once scan() has finished"""
+        if self._risk_score is None:
+            return self._compute_risk_score()
+        return self._risk_score
+
+    def _compute_risk_score(self) -> int:
+        """Calculate risk score (0-100) in one pass over findings"""
+        crit_cnt = 0
+        for pid in self._f_pattern:
+            if _PATTERN_META[pid][0] in self.CRITICAL_CATEGORIES:
+                crit_cnt += 1
+        warn_cnt = len(self._f_pattern) - crit_cnt
         return min(100, crit_cnt * 30 + min(warn_cnt, 10) * 3)
 
+    @property
+    def findings(self) -> List[Dict]:
+        """Findings as dicts, built from the columnar store on first access"""
+        if self._findings is None:
+            self._findings = [
+                {
+                    'file': self._files[fi],
+                    'line': line,
+                    'category': _PATTERN_META[pid][0],
+                    'description': _PATTERN_META[pid][1],
+                    'match': match,
+                }
+                for fi, line, pid, match in zip(self._f_file, self._f_line, self._f_pattern, self._f_match)
+            ]
+        return self._findings
+
+    def _add_findings(self, relative_path: str, rows: List[Row]):
+        """Append one file's finding rows to the columnar store"""
+        fi = len(self._files)
+        self._files.append(relative_path)
+        for pid, line, match in rows:
+            self._f_file.append(fi)
+            self._f_line.append(line)
+            self._f_pattern.append(pid)
+            self._f_match.append(match)
+        self._findings = None
+
     @property
     def risk_level(self) -> str:
         """Get risk level based on score"""
@@ -93,48 +492,294 @@ class SkillScanner:
             print(f"Error: Path not found: {self.skill_path}", file=sys.stderr)
             return [], 1
 
-        for file_path in self.skill_path.rglob('*'):
-            if file_path.is_file() and self._is_text_file(file_path):
-                self._scan_file(file_path)
+        files = [(path, name) for path, name in self._iter_files() if self._is_text_name(name)]
+        cache = FindingsCache.load(self.cache_path) if self.cache_path else None
+
+        # Per-file finding rows in walk order; unchanged files come from the cache
+        results: List[Optional[List[Row]]] = [None] * len(files)
+        if cache:
+            for i, (file_path, _) in enumerate(files):
+                results[i] = cache.lookup(file_path)
+        misses = [i for i, found in enumerate(results) if found is None]
+
+        for i, (found, key) in zip(misses, self._scan_files([files[i] for i in misses], cache)):
+            results[i] = found
+            if cache and found is not None:
+                cache.store(files[i][0], key, found)
+        if cache:
+            cache.save()
+
+        for (file_path, _), rows in zip(files, results):
+            if rows:
+                self._add_findings(file_path[self._root_len:], rows)
+        self._risk_score = self._compute_risk_score()
         return self.findings, 0 if len(self.findings) == 0 else 1
-    
-    def _is_text_file(self, path: Path) -> bool:
-        """Check if file is likely a text file"""
-        text_extensions = {'.py', '.md', '.txt', '.sh', '.bash', '.js', '.json', '.yaml', '.yml', '.toml'}
-        return path.suffix.lower() in text_extensions or path.name == 'SKILL.md'
-    
-    def _scan_file(self, file_path: Path):
-        """Scan a single file for issues"""
+
+    def _scan_files(self, files: List[Tuple[str, str]],
+                    cache: Optional[FindingsCache] = None) -> List[Tuple[Optional[List[Row]], Optional[str]]]:
+        """Scan (path, name) files and return (finding rows, content key) pairs in the same order.
+
+        Content keys are computed from the bytes the scan reads when a cache
+        is given, and are None otherwise. Sequential scans take content the
+        cache already holds (a copied or moved file) from it instead.
+        """
+        hashing = cache is not None
+        workers = os.cpu_count() or 1
+        if len(files) >= self.PARALLEL_MIN_FILES and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(str(self.skill_path), hashing)) as ex:
+                    return list(ex.map(_scan_in_worker, files, chunksize=16))
+            except (OSError, BrokenProcessPool):
+                pass  # No usable process pool here (e.g. no semaphore support)
+        if len(files) < 2:
+            read = ((file_path, name, None, None) for file_path, name in files)
+        else:
+            read = self._prefetch(files, hashing)
+        return [self._scan_keyed(file_path, name, data, digest, hashing, cache)
+                for file_path, name, data, digest in read]
+
+    def _prefetch(self, files: List[Tuple[str, str]],
+                  hashing: bool = False) -> Iterator[Tuple[str, str, Optional[bytes], Optional[str]]]:
+        """Yield (path, name, data, digest) in order while reading ahead on a thread pool.
+
+        At most READ_AHEAD reads are in flight, so memory stays bounded.
+        data is the whole file for files that fit in one scan window, and
+        None for larger or unreadable files, which _scan_file streams itself.
+        With hashing, digest is data's content digest, computed on the
+        reading thread.
+        """
+        limit = self.STREAM_CHUNK_SIZE + self.STREAM_OVERLAP
+        remaining = iter(files)
+        with ThreadPoolExecutor(max_workers=self.READ_THREADS) as ex:
+            pending = deque()
+            for file_path, name in remaining:
+                pending.append((file_path, name, ex.submit(_read_small, file_path, limit, hashing)))
+                if len(pending) >= self.READ_AHEAD:
+                    break
+            while pending:
+                file_path, name, future = pending.popleft()
+                nxt = next(remaining, None)
+                if nxt is not None:
+                    pending.append((nxt[0], nxt[1], ex.submit(_read_small, nxt[0], limit, hashing)))
+                yield (file_path, name) + future.result()
+
+    def _scan_keyed(self, file_path: str, name: str, data: Optional[bytes], digest: Optional[str],
+                    hashing: bool, cache: Optional[FindingsCache] = None) -> Tuple[Optional[List[Row]], Optional[str]]:
+        """Scan one file given the (data, digest) _read_small returned for it.
+
+        Returns (finding rows, content key); the key is None unless hashing.
+        A streamed file is hashed as its windows are read, so every file is
+        read once.
+        """
+        is_doc = _extension(name) in self.DOC_EXTENSIONS
+        if digest is not None:
+            key = FindingsCache.content_key(digest, is_doc)
+            rows = cache.rows_for(key) if cache else None
+            if rows is None:
+                rows = self._scan_file(file_path, name, data)
+            return rows, key
+        hasher = _new_digest() if hashing and data is None else None
+        rows = self._scan_file(file_path, name, data, hasher)
+        if hasher is None:
+            return rows, None
+        return rows, FindingsCache.content_key(hasher.hexdigest(), is_doc)
+
+    def _iter_files(self) -> Iterator[Tuple[str, str]]:
+        """Yield (path, name) for every file under the skill directory.
+
+        Walks with os.scandir, whose entries carry the file type from the
+        directory read, so no Path objects or extra stat calls are needed.
+        Order matches rglob: a directory's files, then its subdirectories
+        depth-first. Symlinked directories are not descended into.
+        """
+        stack = [str(self.skill_path)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path, entry.name
+            except OSError:
+                pass
+            stack.extend(reversed(subdirs))
+
+    def _is_text_name(self, name: str) -> bool:
+        """Check if a file name is likely a text file"""
+        return _extension(name) in _TEXT_EXT or name == 'SKILL.md'
+
+    def _lowered(self, raw: bytes) -> Optional[bytes]:
+        """ASCII-lowercased bytes for literal pretests, or None if they can't be trusted"""
+        if not raw.isascii() and any(b in raw for b in self.CASEFOLD_BYTES):
+            return None
+        return raw.lower()
+
+    @staticmethod
+    def _may_contain(lowered: Optional[bytes], tokens: Tuple[bytes, ...]) -> bool:
+        """Cheap byte-level check for whether any token occurs"""
+        return lowered is None or any(tok in lowered for tok in tokens)
+
+    def _hyperscan_hits(self, raw: bytes) -> Optional[Set[str]]:
+        """Categories with at least one match, found in a single Hyperscan pass.
+
+        Only valid for content scanned with the bytes patterns, which see
+        it the same way Hyperscan does. Returns None when Hyperscan is
+        unavailable; the re gates are used instead.
+        """
+        if self.HYPERSCAN_DB is None:
+            return None
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(self.HYPERSCAN_CATEGORIES[pattern_id])
+
+        self.HYPERSCAN_DB.scan(raw, match_event_handler=on_match)
+        return hits
+
+    def _scan_file(self, file_path: str, name: str, data: Optional[bytes] = None,
+                   hasher=None) -> Optional[List[Row]]:
+        """Scan a single file for issues, one line-aligned window at a time.
+
+        data, when given, is the file's whole content read in advance;
+        otherwise the file is streamed, feeding hasher if one is given.
+        Returns the file's (pattern id, line, match) rows, or None if it
+        could not be scanned.
+        """
         try:
-            content = file_path.read_text()
-            relative_path = file_path.relative_to(self.skill_path)
-            is_doc = file_path.suffix.lower() in ('.md', '.rst', '.txt')
-            lines = content.split('\n')
-
-            for category, patterns in self.PATTERNS.items():
-                # Skip doc files for non-prompt categories
-                if is_doc and category != 'prompt_injection':
-                    continue
-
-                for pattern, description in patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-                    for match in matches:
-                        line_num = content[:match.start()].count('\n') + 1
-
-                        # Check whitelist
-                        line_content = lines[line_num - 1] if line_num <= len(lines) else ''
-                        if any(re.search(wp, line_content) for wp in self.WHITELIST):
-                            continue
-
-                        self.findings.append({
-                            'file': str(relative_path),
-                            'line': line_num,
-                            'category': category,
-                            'description': description,
-                            'match': match.group(0)[:50],  # truncate long matches
-                        })
+            if data is None:
+                windows = _iter_windows(file_path, self.STREAM_CHUNK_SIZE, self.STREAM_OVERLAP, hasher)
+            else:
+                if b'\r' in data:
+                    data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                windows = [(data, len(data))] if data else []
+
+            is_doc = _extension(name) in self.DOC_EXTENSIONS
+            tokens = self.DOC_PREFILTER_TOKENS if is_doc else self.PREFILTER_TOKENS
+            lines_before = 0
+            resume: Dict[int, int] = {}
+            found: List[Row] = []
+
+            for raw, owned in windows:
+                lowered = self._lowered(raw)
+                if self._may_contain(lowered, tokens):
+                    resume = self._scan_window(raw, lowered, owned, is_doc, lines_before, resume, found)
+                else:
+                    resume = {}
+                lines_before += raw.count(b'\n', 0, owned)
+
+            # Report in whole-file order: by pattern id (category, then pattern
+            # within it), then position; the sort is stable
+            found.sort(key=lambda row: row[0])
+            return found
         except Exception as e:
             print(f"Warning: Could not scan {file_path}: {e}", file=sys.stderr)
+            return None
+
+    def _scan_window(self, raw: bytes, lowered: Optional[bytes], owned: int, is_doc: bool,
+                     lines_before: int, resume: Dict[int, int], found: List[Row]) -> Dict[int, int]:
+        """Scan one window of a file, collecting findings that start in its first `owned` bytes.
+
+        Findings are appended to `found` as (pattern id, line, match) rows.
+
+        `resume` maps a pattern id to the byte offset in this
+        window where the previous window's last match of that pattern ended,
+        so matching continues exactly where a whole-file finditer would.
+        Returns the same map for the next window.
+        """
+        # Plain ASCII is scanned as bytes, where the bytes patterns behave
+        # exactly like the str ones. Other text is decoded so Unicode case
+        # folding and whitespace still apply; undecodable text falls back
+        # to the bytes patterns instead of being skipped.
+        content = raw
+        # End of the owned region in content units; it always ends a line
+        own_end = owned
+        if not raw.isascii() or _STR_ONLY_SPACE.search(raw):
+            try:
+                head = raw[:owned].decode(_ENCODING)
+                content = head + raw[owned:].decode(_ENCODING)
+                own_end = len(head)
+            except UnicodeDecodeError:
+                pass
+        is_bytes = content is raw
+        if is_bytes:
+            compiled = self.BYTES_PATTERNS
+            gates = self.BYTES_CATEGORY_GATES
+            newline = b'\n'
+        else:
+            compiled = self.PATTERNS
+            gates = self.CATEGORY_GATES
+            newline = '\n'
+
+        # A single re gate is already one pass for the doc pattern set
+        hs_hits = self._hyperscan_hits(raw) if is_bytes and not is_doc else None
+        overhang = {}
+        hits = []  # (pattern id, match) for owned matches, in report order
+        gate_start = {}  # category -> first gate hit offset, or None if no hit
+        # The prompt-injection regexes are the costliest; skip them outright
+        # when none of their trigger words occurs
+        if not self._may_contain(lowered, self.PROMPT_TRIGGERS):
+            gate_start['prompt_injection'] = None
+
+        for pid in (self.DOC_PATTERN_IDS if is_doc else self.PATTERN_IDS):
+            rx, category, _ = compiled[pid]
+            if category not in gate_start:
+                if hs_hits is not None:
+                    gate_start[category] = 0 if category in hs_hits else None
+                else:
+                    first = gates[category].search(content)
+                    gate_start[category] = first.start() if first else None
+            pos = gate_start[category]
+            if pos is None:
+                continue
+
+            carried = resume.get(pid)
+            if carried:
+                pos = max(pos, carried if is_bytes else len(raw[:carried].decode(_ENCODING, errors='replace')))
+            last_end = 0
+
+            for match in rx.finditer(content, pos):
+                if match.start() >= own_end:
+                    break  # owned by the next window
+                last_end = match.end()
+                hits.append((pid, match))
+
+            # A match running past the owned region carries into the next window
+            if last_end > own_end:
+                tail = content[own_end:last_end]
+                overhang[pid] = len(tail) if is_bytes else len(tail.encode(_ENCODING))
+
+        # Resolve line numbers for all hits in one forward sweep, counting
+        # only the newlines between consecutive distinct match starts
+        line_of = {}
+        line, pos = lines_before + 1, 0
+        for start in sorted({match.start() for _, match in hits}):
+            line += content.count(newline, pos, start)
+            line_of[start] = line
+            pos = start
+
+        for pid, match in hits:
+            start = match.start()
+
+            line_start = content.rfind(newline, 0, start) + 1
+            line_end = content.find(newline, start)
+            if line_end == -1:
+                line_end = len(content)
+            line_content = content[line_start:line_end]
+            if is_bytes:
+                line_content = line_content.decode(_ENCODING, errors='replace')
+            if _is_whitelisted(line_content):
+                continue
+
+            matched = match.group(0)
+            if is_bytes:
+                matched = matched.decode(_ENCODING, errors='replace')
+
+            found.append((pid, line_of[start], matched[:50]))  # truncate long matches
+
+        return overhang
     
     def print_report(self):
         """Print findings in readable format"""
@@ -167,15 +812,35 @@ class SkillScanner:
         print("══════════════════════════════════════")
 
 
+# Per-process scanner used by pool workers, and whether they compute
+# content keys
+_worker_scanner: Optional[SkillScanner] = None
+_worker_hashing = False
+
+
+def _init_worker(skill_path: str, hashing: bool):
+    """Pool initializer: build one scanner per worker process"""
+    global _worker_scanner, _worker_hashing
+    _worker_scanner = SkillScanner(skill_path)
+    _worker_hashing = hashing
+
+
+def _scan_in_worker(item: Tuple[str, str]) -> Tuple[Optional[List[Row]], Optional[str]]:
+    """Scan one (path, name) file in a worker; returns (finding rows, content key)"""
+    file_path, name = item
+    return _worker_scanner._scan_keyed(file_path, name, None, None, _worker_hashing)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Security scanner for ClawHub skills')
     parser.add_argument('skill_directory', help='Path to skill directory to scan')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
     parser.add_argument('--install-if-safe', action='store_true', help='Exit 0 only if safe')
+    parser.add_argument('--no-cache', action='store_true', help='Rescan every file, ignoring the findings cache')
 
     args = parser.parse_args()
 
-    scanner = SkillScanner(args.skill_directory)
+    scanner = SkillScanner(args.skill_directory, cache_path=None if args.no_cache else CACHE_FILE)
     findings, _ = scanner.scan()
 
     if args.json: